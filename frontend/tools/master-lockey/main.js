@@ -1206,9 +1206,13 @@ class MasterLockey extends BaseTool {
   displayConfluenceResults() {
     if (!this.confluenceResults) return;
 
-    const hiddenKeys = this.hiddenKeys || [];
-    let visibleResults = this.confluenceResults.filter((r) => !hiddenKeys.includes(r.key));
-    const hiddenResults = this.confluenceResults.filter((r) => hiddenKeys.includes(r.key));
+    // Partition visible vs hidden in a single pass
+    const hiddenKeys = new Set(this.hiddenKeys || []);
+    let visibleResults = [];
+    const hiddenResults = [];
+    for (const r of this.confluenceResults) {
+      (hiddenKeys.has(r.key) ? hiddenResults : visibleResults).push(r);
+    }
 
     // Build a map of remote lockey data for EN/ID lookup (needed for search)
     const remoteKeyMap = new Map();
@@ -1231,9 +1235,14 @@ class MasterLockey extends BaseTool {
     }
 
     // Count active vs striked vs uncertain
-    const activeCount = visibleResults.filter((r) => r.status === "plain").length;
-    const strikedCount = visibleResults.filter((r) => r.status === "striked").length;
-    const uncertainCount = visibleResults.filter((r) => r.status === "uncertain").length;
+    let activeCount = 0;
+    let strikedCount = 0;
+    let uncertainCount = 0;
+    for (const r of visibleResults) {
+      if (r.status === "plain") activeCount++;
+      else if (r.status === "striked") strikedCount++;
+      else if (r.status === "uncertain") uncertainCount++;
+    }
     const totalCount = visibleResults.length;
 
     // Update EN/ID headers with domain name
@@ -1466,8 +1475,8 @@ class MasterLockey extends BaseTool {
   copyLockeyColumn() {
     if (!this.confluenceResults || this.confluenceResults.length === 0) return;
 
-    const hiddenKeys = this.hiddenKeys || [];
-    const visibleResults = this.confluenceResults.filter((r) => !hiddenKeys.includes(r.key));
+    const hiddenKeys = new Set(this.hiddenKeys || []);
+    const visibleResults = this.confluenceResults.filter((r) => !hiddenKeys.has(r.key));
 
     // Just the lockey keys, one per line
     const content = visibleResults.map((r) => r.key).join("\n");
@@ -1492,8 +1501,8 @@ class MasterLockey extends BaseTool {
   copyTableAsTsv() {
     if (!this.confluenceResults || this.confluenceResults.length === 0) return;
 
-    const hiddenKeys = this.hiddenKeys || [];
-    const visibleResults = this.confluenceResults.filter((r) => !hiddenKeys.includes(r.key));
+    const hiddenKeys = new Set(this.hiddenKeys || []);
+    const visibleResults = this.confluenceResults.filter((r) => !hiddenKeys.has(r.key));
 
     // Build remote key map for EN/ID
     const remoteKeyMap = new Map();
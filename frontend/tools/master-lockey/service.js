@@ -3,6 +3,31 @@
  * Handles data fetching, parsing, and filtering for localization keys
  */
 
+// Lockey column header names (case-insensitive) - exact matches
+const LOCKEY_COLUMN_EXACT_NAMES = ["localization key", "lockey", "loc key", "localizationkey", "loc_key", "localization"];
+
+// Partial matches - if header contains these patterns
+const LOCKEY_COLUMN_PATTERNS = ["lockey", "localization", "loc key"];
+
+// Single alternation so each header is scanned once instead of once per pattern
+const LOCKEY_COLUMN_PATTERN_REGEX = new RegExp(LOCKEY_COLUMN_PATTERNS.join("|"));
+
+// Standalone camelCase: starts with lowercase, only identifier chars
+const STANDALONE_CAMEL_CASE_REGEX = /^[a-z][a-zA-Z0-9]*$/;
+
+// Confluence URL patterns
+const DIGITS_ONLY_REGEX = /^\d+$/;
+const SPACE_PAGES_PATH_REGEX = /\/spaces\/[^/]+\/pages\/(\d+)/;
+const DISPLAY_PATH_REGEX = /\/display\/([^/]+)\/(.+)/;
+
+// Inline-statement preprocessing and embedded camelCase key extraction (see extractCamelCaseKeysFromText)
+const INLINE_KEYWORD_REGEX = /\b(if|else|then|and|or|when|contains|feature)\b/gi;
+const LOWER_BEFORE_CAPS_REGEX = /([a-z])([A-Z]{2,})/g;
+const CAPS_BEFORE_LOWER_REGEX = /([A-Z]{2,})([a-z])/g;
+const COMPARISON_VALUE_PREFIX_REGEX = /([=<>!]=?\s*)([a-zA-Z0-9])([a-z]+[A-Z])/g;
+const WHITESPACE_RUN_REGEX = /\s+/g;
+const EMBEDDED_CAMEL_CASE_REGEX = /\b([a-z][a-zA-Z0-9]*[A-Z][a-zA-Z0-9]*)\b/g;
+
 class MasterLockeyService {
   /**
    * Fetch raw lockey JSON source from a URL using Tauri backend (bypasses CORS)
@@ -74,14 +99,14 @@ class MasterLockeyService {
     });
 
     // Transform data into rows with key + language values
-    const rows = Object.entries(keyCentricData).map(([key, translations]) => {
+    const rows = Object.entries(keyCentricData).map(([key, translations], index) => {
       const row = { key };
 
       languages.forEach((lang) => {
         const value = translations[lang];
 
         // Debug logging for first few rows
-        if (Object.keys(keyCentricData).indexOf(key) < 3) {
+        if (index < 3) {
           console.log(`Key: ${key}, Lang: ${lang}, Value:`, value, `Type: ${typeof value}, Length: ${value?.length}`);
         }
 
@@ -315,7 +340,7 @@ class MasterLockeyService {
       const path = url.pathname;
 
       // Match /display/SPACE/PageTitle pattern
-      const displayMatch = path.match(/\/display\/([^/]+)\/(.+)/);
+      const displayMatch = path.match(DISPLAY_PATH_REGEX);
       if (displayMatch) {
         const space = decodeURIComponent(displayMatch[1]);
         // Page titles in URLs use + for spaces
@@ -340,7 +365,7 @@ class MasterLockeyService {
     const trimmed = input.trim();
 
     // If it's just digits, assume it's a page ID
-    if (/^\d+$/.test(trimmed)) {
+    if (DIGITS_ONLY_REGEX.test(trimmed)) {
       return trimmed;
     }
 
@@ -355,7 +380,7 @@ class MasterLockeyService {
       if (pageIdParam) return pageIdParam;
 
       // Match /spaces/SPACE/pages/PAGEID/... format
-      const spacePagesMatch = url.pathname.match(/\/spaces\/[^/]+\/pages\/(\d+)/);
+      const spacePagesMatch = url.pathname.match(SPACE_PAGES_PATH_REGEX);
       if (spacePagesMatch) return spacePagesMatch[1];
 
       // For short links /x/xxxxx, the ID is base64 encoded - not supported for now
@@ -374,7 +399,7 @@ class MasterLockeyService {
    */
   parseConfluenceTableForLockeys(htmlContent) {
     if (!htmlContent) return [];
-    console.log("[Parse] HTML content:", htmlContent);
+    console.log(`[Parse] HTML content length: ${htmlContent.length}`);
 
     const parser = new DOMParser();
     const doc = parser.parseFromString(htmlContent, "text/html");
@@ -386,15 +411,9 @@ class MasterLockeyService {
 
     console.log(`[Parse] Found ${allTables.length} total tables`);
 
-    // Column name variations (case-insensitive) - exact matches
-    const lockeyColumnExactNames = ["localization key", "lockey", "loc key", "localizationkey", "loc_key", "localization"];
-
-    // Partial matches - if header contains these patterns
-    const lockeyColumnPatterns = ["lockey", "localization", "loc key"];
-
     allTables.forEach((table, tableIndex) => {
       // Skip if this table is nested inside another table's cell (it's a nested table)
-      if (table.closest("td") || table.closest("th")) {
+      if (table.closest("td, th")) {
         console.log(`[Parse] Table ${tableIndex} skipped - nested in td/th`);
         return;
       }
@@ -411,8 +430,8 @@ class MasterLockeyService {
       headerCells.forEach((header) => {
         const colspan = parseInt(header.getAttribute("colspan") || "1", 10);
         const text = (header.textContent || "").trim();
-        // Store the first logical index for this header
-        headers.push({ text, logicalIndex, colspan });
+        // Store the first logical index for this header (lowercased once for matching)
+        headers.push({ text, lower: text.toLowerCase(), logicalIndex, colspan });
         logicalIndex += colspan;
       });
 
@@ -426,8 +445,8 @@ class MasterLockeyService {
 
       // First try exact matches
       headers.forEach((header) => {
-        const text = header.text.toLowerCase();
-        if (lockeyColumnExactNames.includes(text)) {
+        const text = header.lower;
+        if (LOCKEY_COLUMN_EXACT_NAMES.includes(text)) {
           lockeyColIndex = header.logicalIndex;
           matchedHeader = header.text;
           console.log(`[Parse] Found lockey column "${text}" at index ${lockeyColIndex} (exact match)`);
@@ -437,14 +456,11 @@ class MasterLockeyService {
       // If no exact match, try partial matches
       if (lockeyColIndex === -1) {
         headers.forEach((header) => {
-          const text = header.text.toLowerCase();
-          for (const pattern of lockeyColumnPatterns) {
-            if (text.includes(pattern)) {
-              lockeyColIndex = header.logicalIndex;
-              matchedHeader = header.text;
-              console.log(`[Parse] Found lockey column "${header.text}" at index ${lockeyColIndex} (partial match: "${pattern}")`);
-              break;
-            }
+          const patternMatch = LOCKEY_COLUMN_PATTERN_REGEX.exec(header.lower);
+          if (patternMatch) {
+            lockeyColIndex = header.logicalIndex;
+            matchedHeader = header.text;
+            console.log(`[Parse] Found lockey column "${header.text}" at index ${lockeyColIndex} (partial match: "${patternMatch[0]}")`);
           }
         });
       }
@@ -524,7 +540,7 @@ class MasterLockeyService {
           const nestedTable = cell.querySelector("table");
           if (nestedTable) {
             // Try to extract from this nested table
-            const nestedLockeys = this.extractFromNestedTable(nestedTable, lockeyColumnExactNames);
+            const nestedLockeys = this.extractFromNestedTable(nestedTable, LOCKEY_COLUMN_EXACT_NAMES);
             if (nestedLockeys.length > 0) {
               foundNestedTable = true;
               console.log(`[Parse] Row ${rowIndex} cell ${cellIndex} has nested table with ${nestedLockeys.length} lockeys`);
@@ -652,9 +668,6 @@ class MasterLockeyService {
       return results;
     }
 
-    // Column patterns for partial matching
-    const partialPatterns = ["lockey", "localization", "loc key"];
-
     // Find the value column index (case-insensitive), accounting for colspan
     const headerCells = Array.from(headerRow.querySelectorAll("th, td"));
     console.log(
@@ -686,14 +699,12 @@ class MasterLockeyService {
     // If no exact match, try partial matches
     if (valueColIndex === -1) {
       headers.forEach((header) => {
-        for (const pattern of partialPatterns) {
-          if (header.text.includes(pattern)) {
-            valueColIndex = header.logicalIndex;
-            console.log(
-              `[Nested Table] Found matching column "${header.text}" at logical index ${header.logicalIndex} (partial: "${pattern}")`
-            );
-            break;
-          }
+        const patternMatch = LOCKEY_COLUMN_PATTERN_REGEX.exec(header.text);
+        if (patternMatch) {
+          valueColIndex = header.logicalIndex;
+          console.log(
+            `[Nested Table] Found matching column "${header.text}" at logical index ${header.logicalIndex} (partial: "${patternMatch[0]}")`
+          );
         }
       });
     }
@@ -702,7 +713,7 @@ class MasterLockeyService {
       console.log("[Nested Table] No matching column found. Looking for:", columnNames);
       // Fallback: Check for key-value row pattern (e.g., "localizationKey" | "eKtpConfirmationNIKPlaceholder")
       // This handles tables where the first column is the key name and second column is the value
-      const keyValueResults = this.extractFromKeyValueTable(nestedTable, columnNames, partialPatterns);
+      const keyValueResults = this.extractFromKeyValueTable(nestedTable, columnNames, LOCKEY_COLUMN_PATTERN_REGEX);
       if (keyValueResults.length > 0) {
         return keyValueResults;
       }
@@ -800,10 +811,10 @@ class MasterLockeyService {
    * and the second column contains the value (e.g., "eKtpConfirmationNIKPlaceholder")
    * @param {Element} table - Table element
    * @param {string[]} exactNames - Exact key names to match (case-insensitive)
-   * @param {string[]} partialPatterns - Partial patterns to match
+   * @param {RegExp} partialPattern - Partial pattern to match
    * @returns {Array<{key: string, status: string}>} Extracted lockeys with status
    */
-  extractFromKeyValueTable(table, exactNames, partialPatterns) {
+  extractFromKeyValueTable(table, exactNames, partialPattern) {
     const results = [];
     const rows = table.querySelectorAll("tr");
 
@@ -829,12 +840,10 @@ class MasterLockeyService {
 
       // Check partial matches
       if (!isMatch) {
-        for (const pattern of partialPatterns) {
-          if (keyText.includes(pattern)) {
-            isMatch = true;
-            console.log(`[Key-Value Table] Row ${rowIndex}: Found partial key match "${keyText}" (pattern: "${pattern}")`);
-            break;
-          }
+        const patternMatch = partialPattern.exec(keyText);
+        if (patternMatch) {
+          isMatch = true;
+          console.log(`[Key-Value Table] Row ${rowIndex}: Found partial key match "${keyText}" (pattern: "${patternMatch[0]}")`);
         }
       }
 
@@ -868,13 +877,16 @@ class MasterLockeyService {
   isStandaloneCamelCase(value) {
     if (!value || typeof value !== "string") return false;
 
+    // Cheap prefilter: most non-key cell text (sentences, numbers, blanks) fails on the first char
+    const firstChar = value.charCodeAt(0);
+    if (firstChar < 97 || firstChar > 122) return false;
+
     // Reject if contains dots (like "context.x.key" or "prefix.value")
     if (value.includes(".")) return false;
 
     // Basic check: starts with lowercase letter, contains only valid identifier chars
     // camelCase pattern: starts with lowercase, can have uppercase letters
-    const camelCasePattern = /^[a-z][a-zA-Z0-9]*$/;
-    return camelCasePattern.test(value);
+    return STANDALONE_CAMEL_CASE_REGEX.test(value);
   }
 
   /**
@@ -892,26 +904,26 @@ class MasterLockeyService {
     // 1. Handle space-separated lowercase keywords (already have spaces around them)
     //    e.g., "someKey else anotherKey" - just needs word boundary splitting
     //    This regex is safe because it requires word boundaries (spaces/start/end)
-    processedText = processedText.replace(/\b(if|else|then|and|or|when|contains|feature)\b/gi, " $1 ");
+    processedText = processedText.replace(INLINE_KEYWORD_REGEX, " $1 ");
 
     // 2. Add space before ALL-CAPS words (2+ uppercase letters) when preceded by lowercase
     //    e.g., "someLabelELSE" → "someLabel ELSE"
     //    This handles: IFsomething, ELSEanother, THENfoo, etc.
-    processedText = processedText.replace(/([a-z])([A-Z]{2,})/g, "$1 $2");
+    processedText = processedText.replace(LOWER_BEFORE_CAPS_REGEX, "$1 $2");
 
     // 3. Add space after ALL-CAPS words when followed by lowercase
     //    e.g., "ELSEsomeKey" → "ELSE someKey"
-    processedText = processedText.replace(/([A-Z]{2,})([a-z])/g, "$1 $2");
+    processedText = processedText.replace(CAPS_BEFORE_LOWER_REGEX, "$1 $2");
 
     // 4. Separate comparison values from camelCase patterns
     //    When there's "== X<camelCase>", the X is likely a comparison value, not part of the key
     //    e.g., "== AtestScreenLabel" → "== A testScreenLabel"
     //    e.g., "== btestScreenLabel" → "== b testScreenLabel"
     //    This handles HTML list items concatenated without whitespace
-    processedText = processedText.replace(/([=<>!]=?\s*)([a-zA-Z0-9])([a-z]+[A-Z])/g, "$1$2 $3");
+    processedText = processedText.replace(COMPARISON_VALUE_PREFIX_REGEX, "$1$2 $3");
 
     // Clean up multiple spaces
-    processedText = processedText.replace(/\s+/g, " ").trim();
+    processedText = processedText.replace(WHITESPACE_RUN_REGEX, " ").trim();
 
     console.log(`[ExtractFromText] Preprocessed text: "${processedText}"`);
 
@@ -920,8 +932,7 @@ class MasterLockeyService {
     // - Contain at least one uppercase letter (true camelCase)
     // - Only alphanumeric characters
     // - 15+ characters to filter out common programming keywords
-    const pattern = /\b([a-z][a-zA-Z0-9]*[A-Z][a-zA-Z0-9]*)\b/g;
-    const matches = [...processedText.matchAll(pattern)];
+    const matches = [...processedText.matchAll(EMBEDDED_CAMEL_CASE_REGEX)];
 
     const results = [];
     for (const match of matches) {
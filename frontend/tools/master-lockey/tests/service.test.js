@@ -246,6 +246,29 @@ describe("MasterLockeyService", () => {
   // Confluence Integration Tests
   // =====================
 
+  describe("extractPageId", () => {
+    it("should return plain numeric IDs as-is", () => {
+      expect(service.extractPageId(" 123456 ")).toBe("123456");
+    });
+
+    it("should read the pageId query parameter", () => {
+      expect(service.extractPageId("https://confluence.example.com/pages/viewpage.action?pageId=98765")).toBe("98765");
+    });
+
+    it("should extract the ID from /spaces/SPACE/pages/ID URLs", () => {
+      expect(service.extractPageId("https://confluence.example.com/spaces/DEV/pages/4242/Some+Page")).toBe("4242");
+      expect(service.extractPageId("https://confluence.example.com/wiki/spaces/DEV/pages/4242")).toBe("4242");
+      expect(service.extractPageId("https://confluence.example.com/spaces/DEV/pages/4242abc")).toBe("4242");
+      expect(service.extractPageId("https://confluence.example.com/spaces/pages/spaces/DEV/pages/77")).toBe("77");
+    });
+
+    it("should return null when no page ID is present", () => {
+      expect(service.extractPageId("https://confluence.example.com/spaces/DEV/overview")).toBeNull();
+      expect(service.extractPageId("https://confluence.example.com/display/DEV/Some+Page")).toBeNull();
+      expect(service.extractPageId("not a url")).toBeNull();
+    });
+  });
+
   describe("parseConfluenceTableForLockeys", () => {
     it("should parse table with 'Localization Key' header", () => {
       const html = `
@@ -438,6 +461,8 @@ describe("MasterLockeyService", () => {
       expect(service.isStandaloneCamelCase(null)).toBe(false);
       expect(service.isStandaloneCamelCase("123key")).toBe(false);
       expect(service.isStandaloneCamelCase("Key")).toBe(false); // Starts with uppercase
+      expect(service.isStandaloneCamelCase(" myKey")).toBe(false); // Leading whitespace
+      expect(service.isStandaloneCamelCase("-myKey")).toBe(false); // Leading punctuation
     });
   });
 
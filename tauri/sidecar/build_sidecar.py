@@ -68,6 +68,8 @@ def main():
         "--hidden-import", "uvicorn.logging",
         "--hidden-import", "uvicorn.loops",
         "--hidden-import", "uvicorn.loops.auto",
+        "--hidden-import", "uvicorn.loops.uvloop",
+        "--hidden-import", "uvloop",
         "--hidden-import", "uvicorn.protocols",
         "--hidden-import", "uvicorn.protocols.http",
         "--hidden-import", "uvicorn.protocols.http.auto",
@@ -75,6 +77,7 @@ def main():
         "--hidden-import", "uvicorn.protocols.websockets.auto",
         "--hidden-import", "uvicorn.lifespan",
         "--hidden-import", "uvicorn.lifespan.on",
+        "--hidden-import", "orjson",
         # Cryptography is required by oracledb thin mode
         "--hidden-import", "cryptography",
         "--hidden-import", "cryptography.hazmat.primitives.ciphers",
@@ -18,12 +18,15 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+from itertools import repeat
 from threading import Lock
 from typing import Any, Optional
 
 import oracledb
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 import uvicorn
 
@@ -44,6 +47,8 @@ POOL_MAX = 5
 POOL_INCREMENT = 1
 POOL_TIMEOUT = 120  # Close idle connections after 2 minutes
 POOL_GETMODE = oracledb.POOL_GETMODE_WAIT
+DB_WORKERS = POOL_MAX * 2  # Threads for blocking DB calls; lets more than one pool run at full size
+FETCH_ARRAYSIZE_MAX = 1000  # Upper bound for cursor.arraysize / prefetchrows
 PORT = 21522  # Sidecar port (easy to remember: 2 + Oracle default 1521)
 
 
@@ -103,7 +108,7 @@ class PoolManager:
 
     def __init__(self):
         self._pools: dict[str, oracledb.ConnectionPool] = {}
-        self._last_used: dict[str, datetime] = {}
+        self._last_used: dict[str, float] = {}  # time.monotonic() of last use
         self._lock = Lock()
         self._cleanup_task: Optional[asyncio.Task] = None
 
@@ -115,6 +120,12 @@ class PoolManager:
         """Get or create a connection pool for the given config."""
         key = self._pool_key(config)
 
+        # Fast path: pool already exists, no lock needed (dict get/set are atomic)
+        pool = self._pools.get(key)
+        if pool is not None:
+            self._last_used[key] = time.monotonic()
+            return pool
+
         with self._lock:
             if key not in self._pools:
                 logger.info(f"Creating new pool for: {key}")
@@ -130,7 +141,7 @@ class PoolManager:
                 )
                 self._pools[key] = pool
 
-            self._last_used[key] = datetime.now()
+            self._last_used[key] = time.monotonic()
             return self._pools[key]
 
     def close_pool(self, key: str) -> None:
@@ -143,7 +154,8 @@ class PoolManager:
                 except Exception as e:
                     logger.warning(f"Error closing pool {key}: {e}")
                 del self._pools[key]
-                del self._last_used[key]
+            # May exist without a pool if a lock-free get_pool raced the close
+            self._last_used.pop(key, None)
 
     def close_all(self) -> None:
         """Close all pools (called on shutdown)."""
@@ -161,13 +173,12 @@ class PoolManager:
         """Periodically close pools that haven't been used recently."""
         while True:
             await asyncio.sleep(60)  # Check every minute
-            now = datetime.now()
-            idle_threshold = timedelta(seconds=POOL_TIMEOUT)
+            now = time.monotonic()
 
             keys_to_close = []
             with self._lock:
-                for key, last_used in self._last_used.items():
-                    if now - last_used > idle_threshold:
+                for key, last_used in list(self._last_used.items()):
+                    if now - last_used > POOL_TIMEOUT:
                         keys_to_close.append(key)
 
             for key in keys_to_close:
@@ -186,9 +197,8 @@ class PoolManager:
 
     @property
     def pool_count(self) -> int:
-        """Return number of active pools."""
-        with self._lock:
-            return len(self._pools)
+        """Return number of active pools (len() of a dict is atomic, no lock needed)."""
+        return len(self._pools)
 
 
 # Global pool manager
@@ -197,15 +207,45 @@ pool_manager = PoolManager()
 
 def output_type_handler(cursor, metadata):
     """Let oracledb handle type conversion at the C level."""
-    if metadata.type_code == oracledb.DB_TYPE_CLOB:
+    if metadata.type_code in (oracledb.DB_TYPE_CLOB, oracledb.DB_TYPE_NCLOB):
         return cursor.var(str, arraysize=cursor.arraysize)
     if metadata.type_code == oracledb.DB_TYPE_BLOB:
         return cursor.var(bytes, arraysize=cursor.arraysize)
     if metadata.type_code in (oracledb.DB_TYPE_DATE, oracledb.DB_TYPE_TIMESTAMP):
         return cursor.var(str, arraysize=cursor.arraysize)
+    if metadata.type_code in (oracledb.DB_TYPE_TIMESTAMP_TZ, oracledb.DB_TYPE_TIMESTAMP_LTZ):
+        # Serialize during fetch so rows don't need a second Python pass. oracledb returns
+        # naive datetimes for these types, so no UTC offset is emitted (same as _convert_value)
+        return cursor.var(
+            metadata.type_code,
+            arraysize=cursor.arraysize,
+            outconverter=datetime.isoformat,
+        )
+
+
+# Column types whose fetched values are already JSON-safe (str/int/float/bool/None)
+# once output_type_handler has been applied, so rows can skip _convert_value.
+_PASSTHROUGH_DB_TYPES = frozenset({
+    oracledb.DB_TYPE_VARCHAR,
+    oracledb.DB_TYPE_NVARCHAR,
+    oracledb.DB_TYPE_CHAR,
+    oracledb.DB_TYPE_NCHAR,
+    oracledb.DB_TYPE_LONG,
+    oracledb.DB_TYPE_NUMBER,
+    oracledb.DB_TYPE_BINARY_INTEGER,
+    oracledb.DB_TYPE_BINARY_FLOAT,
+    oracledb.DB_TYPE_BINARY_DOUBLE,
+    oracledb.DB_TYPE_BOOLEAN,
+    oracledb.DB_TYPE_DATE,
+    oracledb.DB_TYPE_TIMESTAMP,
+    oracledb.DB_TYPE_TIMESTAMP_TZ,
+    oracledb.DB_TYPE_TIMESTAMP_LTZ,
+    oracledb.DB_TYPE_CLOB,
+    oracledb.DB_TYPE_NCLOB,
+})
 
 # Thread pool for offloading blocking DB operations from the asyncio event loop
-_db_executor = ThreadPoolExecutor(max_workers=4)
+_db_executor = ThreadPoolExecutor(max_workers=DB_WORKERS)
 
 
 # =============================================================================
@@ -322,6 +362,23 @@ def _convert_value(val):
     return str(val)
 
 
+def _columns_needing_conversion(description) -> list[int]:
+    """Return indexes of result columns whose values must go through _convert_value."""
+    return [i for i, col in enumerate(description) if col[1] not in _PASSTHROUGH_DB_TYPES]
+
+
+def _json_response(result: dict) -> Response:
+    """
+    Encode a query result with orjson, falling back to the stdlib encoder.
+    orjson rejects integers outside the 64-bit range, which NUMBER(38) columns can return.
+    """
+    try:
+        body = orjson.dumps(result)
+    except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+        return JSONResponse(result)
+    return Response(content=body, media_type="application/json")
+
+
 def _execute_query_sync(request: QueryRequest, as_dict: bool = False):
     """Synchronous query execution — runs in thread pool to avoid blocking the event loop."""
     start_time = time.perf_counter()
@@ -331,26 +388,43 @@ def _execute_query_sync(request: QueryRequest, as_dict: bool = False):
     with pool.acquire() as conn:
         conn.outputtypehandler = output_type_handler
         cursor = conn.cursor()
-        cursor.arraysize = 500
+        # Size fetch buffers to the row budget; prefetchrows one past arraysize
+        # lets a full max_rows result (and its end) arrive in one round-trip
+        cursor.arraysize = min(request.max_rows or FETCH_ARRAYSIZE_MAX, FETCH_ARRAYSIZE_MAX)
+        cursor.prefetchrows = cursor.arraysize + 1
         cursor.execute(request.sql)
 
-        columns = [col[0] for col in cursor.description] if cursor.description else []
-
-        if request.max_rows:
-            rows = cursor.fetchmany(request.max_rows)
-        else:
-            rows = cursor.fetchall()
-
-        if as_dict:
-            result_rows = [
-                {columns[i]: _convert_value(val) for i, val in enumerate(row)}
-                for row in rows
-            ]
-        else:
-            result_rows = [
-                [_convert_value(val) for val in row]
-                for row in rows
-            ]
+        description = cursor.description or []
+        columns = [col[0] for col in description]
+        convert_cols = _columns_needing_conversion(description)
+
+        # Convert batch by batch so the raw result is never held alongside the converted one
+        result_rows = []
+        # Hoist per-cell names to locals for the hot loop
+        append = result_rows.append
+        convert = _convert_value
+        remaining = request.max_rows or None
+        while remaining is None or remaining > 0:
+            batch_size = cursor.arraysize if remaining is None else min(cursor.arraysize, remaining)
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            if not convert_cols:
+                # Every column is already JSON-safe: build rows entirely in C
+                if as_dict:
+                    result_rows.extend(map(dict, map(zip, repeat(columns), rows)))
+                else:
+                    result_rows.extend(map(list, rows))
+            else:
+                for row in rows:
+                    values = list(row)
+                    for i in convert_cols:
+                        val = values[i]
+                        if val is not None:
+                            values[i] = convert(val)
+                    append(dict(zip(columns, values)) if as_dict else values)
+            if remaining is not None:
+                remaining -= len(rows)
 
         elapsed_ms = (time.perf_counter() - start_time) * 1000
 
@@ -362,15 +436,19 @@ def _execute_query_sync(request: QueryRequest, as_dict: bool = False):
         }
 
 
-@app.post("/query", response_model=QueryResponse)
+@app.post("/query", responses={200: {"model": QueryResponse}})
 async def execute_query(request: QueryRequest):
-    """Execute a SQL query and return results."""
+    """
+    Execute a SQL query and return results.
+    The result dict is already JSON-safe, so it is serialized directly with orjson
+    instead of being re-validated cell by cell through QueryResponse.
+    """
     try:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
             _db_executor, _execute_query_sync, request, False
         )
-        return QueryResponse(**result)
+        return _json_response(result)
     except oracledb.Error as e:
         error = oracle_error_to_response(e)
         raise HTTPException(status_code=400, detail=error.model_dump())
@@ -386,11 +464,11 @@ async def execute_query_dict(request: QueryRequest):
     More convenient for frontend consumption.
     """
     try:
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
             _db_executor, _execute_query_sync, request, True
         )
-        return result
+        return _json_response(result)
     except oracledb.Error as e:
         error = oracle_error_to_response(e)
         raise HTTPException(status_code=400, detail=error.model_dump())
@@ -402,7 +480,7 @@ async def execute_query_dict(request: QueryRequest):
 @app.post("/query-batch")
 async def execute_batch(request: BatchQueryRequest):
     """Execute multiple queries in parallel, return all results."""
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     tasks = [
         loop.run_in_executor(_db_executor, _execute_query_sync, q, False)
         for q in request.queries
@@ -422,18 +500,27 @@ async def execute_batch(request: BatchQueryRequest):
 @app.get("/pools")
 async def list_pools():
     """List active connection pools (for debugging)."""
-    with pool_manager._lock:
-        pools = []
-        for key, pool in pool_manager._pools.items():
+    # Read a snapshot without the lock so polling never stalls the event loop on it
+    # Map monotonic last-used stamps back to wall-clock time for display
+    now_mono = time.monotonic()
+    now_wall = datetime.now()
+    pools = []
+    for key, pool in list(pool_manager._pools.items()):
+        last_used = pool_manager._last_used.get(key)
+        if last_used is None:
+            continue  # Closed since the snapshot was taken
+        try:
             pools.append({
                 "key": key,
                 "busy": pool.busy,
                 "opened": pool.opened,
                 "min": pool.min,
                 "max": pool.max,
-                "last_used": pool_manager._last_used[key].isoformat()
+                "last_used": (now_wall - timedelta(seconds=now_mono - last_used)).isoformat()
             })
-        return {"pools": pools}
+        except oracledb.Error:
+            continue  # Closed while being read
+    return {"pools": pools}
 
 
 # =============================================================================
@@ -0,0 +1,48 @@
+"""Unit tests for the Oracle sidecar that don't need a live database."""
+
+import json
+
+import orjson
+from fastapi.testclient import TestClient
+
+import oracle_sidecar
+
+BIG_INT = 10**20  # NUMBER(38) value outside orjson's 64-bit integer range
+
+
+def _result(rows):
+    return {"columns": ["ID"], "rows": rows, "row_count": len(rows), "execution_time_ms": 1.0}
+
+
+def test_json_response_encodes_ints_beyond_64_bits():
+    response = oracle_sidecar._json_response(_result([[BIG_INT]]))
+    assert json.loads(response.body)["rows"] == [[BIG_INT]]
+
+
+def test_json_response_uses_orjson_for_regular_results():
+    result = _result([[1, "a", None]])
+    response = oracle_sidecar._json_response(result)
+    assert response.media_type == "application/json"
+    assert response.body == orjson.dumps(result)
+
+
+def test_query_endpoints_return_big_ints(monkeypatch):
+    def fake_execute(request, as_dict=False):
+        if as_dict:
+            return _result([{"ID": BIG_INT}])
+        return _result([[BIG_INT]])
+
+    monkeypatch.setattr(oracle_sidecar, "_execute_query_sync", fake_execute)
+    client = TestClient(oracle_sidecar.app)
+    payload = {
+        "connection": {"name": "DEV", "connect_string": "host:1521/svc", "username": "u", "password": "p"},
+        "sql": "SELECT id FROM dual",
+    }
+
+    response = client.post("/query", json=payload)
+    assert response.status_code == 200
+    assert response.json()["rows"] == [[BIG_INT]]
+
+    response = client.post("/query-dict", json=payload)
+    assert response.status_code == 200
+    assert response.json()["rows"] == [{"ID": BIG_INT}]
@@ -3,6 +3,49 @@
 
 use reqwest::Client;
 use serde::{Deserialize, Serialize};
+use std::time::Duration;
+
+/// Retries after the first attempt for transient failures (429/5xx, connect errors)
+const MAX_RETRIES: u32 = 3;
+/// Backoff before retry N is RETRY_BACKOFF_BASE_MS * 2^N (500ms, 1s, 2s)
+#[cfg(not(test))]
+const RETRY_BACKOFF_BASE_MS: u64 = 500;
+/// Keep retry tests fast; hit counts are still asserted
+#[cfg(test)]
+const RETRY_BACKOFF_BASE_MS: u64 = 1;
+
+fn is_retryable(result: &Result<reqwest::Response, reqwest::Error>) -> bool {
+    match result {
+        Ok(response) => matches!(response.status().as_u16(), 429 | 500 | 502 | 503 | 504),
+        // Timeouts are not retried: each one already cost the full client timeout
+        Err(e) => e.is_connect(),
+    }
+}
+
+/// Send a GET request, retrying transient failures with exponential backoff
+/// Used for Confluence and lockey JSON fetches over flaky VPN links
+pub async fn send_with_retry(
+    request: reqwest::RequestBuilder,
+) -> Result<reqwest::Response, reqwest::Error> {
+    let mut attempt = 0;
+    loop {
+        let result = match request.try_clone() {
+            Some(req) if attempt < MAX_RETRIES => req.send().await,
+            _ => return request.send().await,
+        };
+        if !is_retryable(&result) {
+            return result;
+        }
+        log::warn!(
+            "Transient HTTP failure, retrying (attempt {} of {})",
+            attempt + 1,
+            MAX_RETRIES
+        );
+        let backoff = Duration::from_millis(RETRY_BACKOFF_BASE_MS * 2u64.pow(attempt));
+        tokio::time::sleep(backoff).await;
+        attempt += 1;
+    }
+}
 
 /// Page information returned from Confluence search
 #[derive(Debug, Serialize, Deserialize)]
@@ -77,21 +120,22 @@ pub async fn fetch_page_content(
         page_id
     );
 
-    let response = client
-        .get(&url)
-        .bearer_auth(pat)
-        .header("X-Atlassian-Token", "no-check")
-        .send()
-        .await
-        .map_err(|e| {
-            if e.is_timeout() {
-                "Request timed out after 30 seconds".to_string()
-            } else if e.is_connect() {
-                format!("Connection error: Unable to connect to Confluence. Check the URL and network.")
-            } else {
-                format!("Network error: {}", e)
-            }
-        })?;
+    let response = send_with_retry(
+        client
+            .get(&url)
+            .bearer_auth(pat)
+            .header("X-Atlassian-Token", "no-check"),
+    )
+    .await
+    .map_err(|e| {
+        if e.is_timeout() {
+            "Request timed out after 30 seconds".to_string()
+        } else if e.is_connect() {
+            format!("Connection error: Unable to connect to Confluence. Check the URL and network.")
+        } else {
+            format!("Network error: {}", e)
+        }
+    })?;
 
     let status = response.status();
     if status == reqwest::StatusCode::UNAUTHORIZED {
@@ -154,14 +198,17 @@ pub async fn fetch_page_by_space_title(
             urlencoding::encode(title)
         );
 
-        let response = match client
-            .get(&url)
-            .bearer_auth(pat)
-            .header("X-Atlassian-Token", "no-check")
-            .send()
-            .await
+        let response = match send_with_retry(
+            client
+                .get(&url)
+                .bearer_auth(pat)
+                .header("X-Atlassian-Token", "no-check"),
+        )
+        .await
         {
             Ok(r) => r,
+            // Both prefixes hit the same host: a connect failure (already retried) won't recover
+            Err(e) if e.is_connect() => break,
             Err(_) => continue, // Try next prefix
         };
 
@@ -236,13 +283,14 @@ pub async fn search_pages(
         urlencoding::encode(&cql)
     );
 
-    let response = client
-        .get(&url)
-        .bearer_auth(pat)
-        .header("X-Atlassian-Token", "no-check")
-        .send()
-        .await
-        .map_err(|e| format!("Network error: {}", e))?;
+    let response = send_with_retry(
+        client
+            .get(&url)
+            .bearer_auth(pat)
+            .header("X-Atlassian-Token", "no-check"),
+    )
+    .await
+    .map_err(|e| format!("Network error: {}", e))?;
 
     let status = response.status();
     if status == reqwest::StatusCode::UNAUTHORIZED {
@@ -346,10 +394,31 @@ mod tests {
         assert!(result.unwrap_err().contains("Authentication failed"));
     }
 
+    #[tokio::test]
+    async fn fetch_page_content_retries_transient_errors() {
+        let server = MockServer::start();
+        let m = server.mock(|when, then| {
+            when.method(GET).path_contains("/rest/api/content/");
+            then.status(503);
+        });
+
+        let result = fetch_page_content(
+            &client(),
+            &server.base_url(),
+            "12345",
+            "user",
+            "pat123",
+        )
+        .await;
+
+        assert!(result.unwrap_err().contains("HTTP 503"));
+        m.assert_hits(1 + MAX_RETRIES as usize);
+    }
+
     #[tokio::test]
     async fn fetch_page_content_handles_404() {
         let server = MockServer::start();
-        let _m = server.mock(|when, then| {
+        let m = server.mock(|when, then| {
             when.method(GET).path_contains("/rest/api/content/");
             then.status(404);
         });
@@ -365,6 +434,7 @@ mod tests {
 
         assert!(result.is_err());
         assert!(result.unwrap_err().contains("Page not found"));
+        m.assert_hits(1); // 404 is not retried
     }
 
     #[tokio::test]
@@ -473,6 +543,22 @@ mod tests {
         assert!(result.unwrap_err().contains("not found"));
     }
 
+    #[tokio::test]
+    async fn fetch_page_by_space_title_stops_on_connect_error() {
+        // Nothing listens on port 1, so every attempt fails to connect
+        let result = fetch_page_by_space_title(
+            &client(),
+            "http://127.0.0.1:1",
+            "EV",
+            "Some Page",
+            "user",
+            "pat123",
+        )
+        .await;
+
+        assert!(result.unwrap_err().contains("Could not connect"));
+    }
+
     #[tokio::test]
     async fn fetch_page_by_space_title_handles_401() {
         let server = MockServer::start();
@@ -1,5 +1,5 @@
 use std::collections::HashMap;
-use std::sync::Mutex;
+use std::sync::{Mutex, OnceLock};
 use tauri::menu::{Menu, MenuItem, PredefinedMenuItem, Submenu};
 
 // Zoom state: stores current zoom level (default 90%, range 80%-110%)
@@ -386,14 +386,21 @@ fn jira_http_client(allow_invalid_tls: bool) -> Result<Client, String> {
     .map_err(|_| "Failed to initialize the Jira HTTP client.".to_string())
 }
 
+static CONFLUENCE_HTTP_CLIENT: OnceLock<Client> = OnceLock::new();
+
 // HTTP client for Confluence that accepts invalid/self-signed SSL certs
 // Needed for Confluence instances on IP addresses or with internal certs
-fn confluence_http_client() -> Client {
-  Client::builder()
-    .timeout(Duration::from_secs(30))
-    .danger_accept_invalid_certs(true)
-    .build()
-    .expect("failed to build confluence http client")
+// Shared across commands so keep-alive connections are reused instead of
+// paying a new TCP+TLS handshake for every page/lockey fetch
+fn confluence_http_client() -> &'static Client {
+  CONFLUENCE_HTTP_CLIENT.get_or_init(|| {
+    Client::builder()
+      .timeout(Duration::from_secs(30))
+      .danger_accept_invalid_certs(true)
+      .pool_max_idle_per_host(8)
+      .build()
+      .expect("failed to build confluence http client")
+  })
 }
 
 pub async fn load_credentials(username: String) -> Result<Credentials, String> {
@@ -585,21 +592,15 @@ fn get_arch() -> String {
 // Used by Master Lockey tool to fetch localization data
 #[tauri::command]
 async fn fetch_lockey_json(url: String) -> Result<String, String> {
-  // Build a more permissive client for development (accepts invalid SSL certs)
-  let client = Client::builder()
-    .timeout(Duration::from_secs(30))
-    .danger_accept_invalid_certs(true) // Allow self-signed/invalid SSL certs
-    .build()
-    .map_err(|e| format!("Failed to build HTTP client: {}", e))?;
+  // Permissive shared client (accepts invalid SSL certs), same as Confluence
+  let client = confluence_http_client();
   
   // Validate URL format
   if !url.starts_with("http://") && !url.starts_with("https://") {
     return Err(format!("Invalid URL format: must start with http:// or https://"));
   }
   
-  let response = client
-    .get(&url)
-    .send()
+  let response = confluence::send_with_retry(client.get(&url))
     .await
     .map_err(|e| {
       // Provide more specific error messages based on error type
@@ -668,10 +669,14 @@ async fn save_lockey_cache(
     "timestamp": chrono::Utc::now().timestamp_millis()
   });
   
-  let json_string = serde_json::to_string_pretty(&cache_data)
+  // Stream compact JSON straight to disk: the cache can hold the full raw lockey
+  // source, and pretty-printing it into an intermediate String doubled the work
+  let file = std::fs::File::create(&cache_file)
+    .map_err(|e| format!("Failed to write cache file: {}", e))?;
+  let mut writer = std::io::BufWriter::new(file);
+  serde_json::to_writer(&mut writer, &cache_data)
     .map_err(|e| format!("Failed to serialize cache: {}", e))?;
-  
-  std::fs::write(&cache_file, json_string)
+  std::io::Write::flush(&mut writer)
     .map_err(|e| format!("Failed to write cache file: {}", e))?;
   
   Ok(())
@@ -756,7 +761,7 @@ async fn confluence_fetch_page(
 ) -> Result<confluence::PageContent, String> {
   let pat = load_confluence_pat().await?;
   let client = confluence_http_client();
-  confluence::fetch_page_content(&client, &domain, &page_id, &username, &pat).await
+  confluence::fetch_page_content(client, &domain, &page_id, &username, &pat).await
 }
 
 #[tauri::command]
@@ -767,7 +772,7 @@ async fn confluence_search_pages(
 ) -> Result<Vec<confluence::PageInfo>, String> {
   let pat = load_confluence_pat().await?;
   let client = confluence_http_client();
-  confluence::search_pages(&client, &domain, &query, &username, &pat).await
+  confluence::search_pages(client, &domain, &query, &username, &pat).await
 }
 
 #[tauri::command]
@@ -779,7 +784,7 @@ async fn confluence_fetch_by_space_title(
 ) -> Result<confluence::PageContent, String> {
   let pat = load_confluence_pat().await?;
   let client = confluence_http_client();
-  confluence::fetch_page_by_space_title(&client, &domain, &space_key, &title, &username, &pat).await
+  confluence::fetch_page_by_space_title(client, &domain, &space_key, &title, &username, &pat).await
 }
 
 // Jira integration commands